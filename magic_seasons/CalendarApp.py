@@ -1,6 +1,8 @@
 # DND Calendar — DM Edition
 
-import json, os, tkinter as tk
+import json, os, ntpath, shutil, tkinter as tk
+from bisect import bisect_right
+from collections import namedtuple
 from tkinter import ttk, simpledialog, messagebox
 import textwrap
 
@@ -13,14 +15,47 @@ BASE_MONTH_LENGTHS   = [31,28,31,30,31,30,31,31,30,31,30,31]
 DAYS_IN_MAGIC_SEASON = 59
 SEASONS       = ["Winter","Spring","Summer","Fall"]
 MAGIC_SEASONS = ["Low","Mid","High"]
-
-# ───────── DATE + HOUR HELPERS ─────────
-def is_leap(y): return y%4==0
-def year_length(y): return 366 if is_leap(y) else 365
-def month_lengths_for(y):
-    ml=BASE_MONTH_LENGTHS.copy()
-    if is_leap(y): ml[1]=29
-    return ml
+WORKSPACE_FILE = "workspace.json"
+CAMPAIGNS_DIR  = "campaigns"
+CAMPAIGN_ERRORS = (ValueError, OSError, KeyError)   # what loading/saving a campaign can raise
+DEFAULT_CALENDAR = "magic_seasons"
+CALENDARS = {
+    "magic_seasons": {
+        "months": ["Silence","Khord","Maiden's Blight","Ortide","Verenin","Song","Grishleaf","Solian","Marthos","Illumi","Restos","Veil"],
+        "month_lengths": BASE_MONTH_LENGTHS,
+        "leap_every": 4,      # years; year 0 is a leap year
+        "leap_month": 1,      # 0-based month that gains the leap day
+    },
+}
+YEAR_TABLE_SPAN = 10000   # years pre-indexed per calendar definition
+
+# ───────── SHARED CALENDAR TABLES ─────────
+# Read-only lookup tables, built once per calendar definition and shared by
+# every campaign running on it.
+class CalendarTables(namedtuple("CalendarTables", "months month_lengths leap_month_lengths leap_every year_starts")):
+    __slots__ = ()
+
+    def is_leap(self,y): return y%self.leap_every==0
+    def year_length(self,y): return sum(self.leap_month_lengths if self.is_leap(y) else self.month_lengths)
+    def month_lengths_for(self,y): return self.leap_month_lengths if self.is_leap(y) else self.month_lengths
+
+_TABLES = {}
+
+def calendar_tables(name=DEFAULT_CALENDAR):
+    t=_TABLES.get(name)
+    if t is None:
+        if name not in CALENDARS:
+            raise KeyError(f"Unknown calendar definition: {name}")
+        d=CALENDARS[name]
+        if len(d["months"])!=len(d["month_lengths"]):
+            raise ValueError(f"Calendar {name}: months and month_lengths differ in length")
+        ml=tuple(d["month_lengths"]); lml=list(ml); lml[d["leap_month"]]+=1
+        t=CalendarTables(tuple(d["months"]),ml,tuple(lml),d["leap_every"],())
+        starts=[0]
+        for y in range(YEAR_TABLE_SPAN):
+            starts.append(starts[-1]+t.year_length(y))
+        t=_TABLES[name]=t._replace(year_starts=tuple(starts))
+    return t
 
 # ───────── CORE MODEL ─────
 class FantasyCalendar:
@@ -43,8 +78,10 @@ class FantasyCalendar:
     """
 
 
-    def __init__(self):
-        self.months=["Silence","Khord","Maiden's Blight","Ortide","Verenin","Song","Grishleaf","Solian","Marthos","Illumi","Restos","Veil"]
+    def __init__(self, campaign=None):
+        self.campaign=campaign
+        self.tables=calendar_tables(campaign.calendar if campaign else DEFAULT_CALENDAR)
+        self.months=self.tables.months
         self.magic_seasons=MAGIC_SEASONS
         self.seasons=SEASONS
         self._load_strands()
@@ -54,6 +91,9 @@ class FantasyCalendar:
         self.current_hour = self._load_hour()
 
     # ----- JSON -----    
+    def _file(self,kind,default):
+        return self.campaign.path(kind) if self.campaign else default
+
     def _load_json(self,fname,default):
         p=os.path.join(os.path.dirname(__file__),fname)
         try:
@@ -64,18 +104,18 @@ class FantasyCalendar:
 
     def _load_strands(self):
         blank={"Name":"","Hidden":"No","Description":"","Low_Effect":"","Mid_Effect":"","High_Effect":""}
-        raw,_=self._load_json(STRANDS_FILE,{})
+        raw,_=self._load_json(self._file("strands",STRANDS_FILE),{})
         self.strand_effect={i:raw.get(str(i),blank.copy()) for i in range(1,97)}
 
     def _load_notes(self):
-        self.notes,self._notes_path=self._load_json(NOTES_FILE,{})
+        self.notes,self._notes_path=self._load_json(self._file("notes",NOTES_FILE),{})
 
     def _save_notes(self):
         json.dump(self.notes, open(self._notes_path,"w",encoding="utf-8"), indent=2, ensure_ascii=False)
 
     # ----- saved dates -----
     def _load_saved_dates(self):
-        self.saved_dates, self._saved_dates_path = self._load_json(SAVED_DATES_FILE, {})
+        self.saved_dates, self._saved_dates_path = self._load_json(self._file("saved_dates",SAVED_DATES_FILE), {})
 
     def _save_saved_dates(self):
         json.dump(self.saved_dates, open(self._saved_dates_path,"w",encoding="utf-8"), indent=2, ensure_ascii=False)
@@ -105,7 +145,7 @@ class FantasyCalendar:
         else:
             self.set_date(data["y"], data["m"]+1, data["d"])  # month expected 1-12
             return True
-        open(self.STATE_FILE,"w").write(str(self.total_days))
+        open(self._file("date",self.STATE_FILE),"w").write(str(self.total_days))
         return True
 
     # ----- entry -----    
@@ -149,10 +189,12 @@ class FantasyCalendar:
     # ----- date math -----    
     def _comp(self,off=0):
         d=self.total_days+off
-        y=0
-        while d>=year_length(y):
-            d-=year_length(y); y+=1
-        ml=month_lengths_for(y)
+        ys=self.tables.year_starts
+        y=max(bisect_right(ys,d)-1,0)
+        d-=ys[y]
+        while d>=self.tables.year_length(y):
+            d-=self.tables.year_length(y); y+=1
+        ml=self.tables.month_lengths_for(y)
         m=0
         while d>=ml[m]:
             d-=ml[m]; m+=1
@@ -160,7 +202,7 @@ class FantasyCalendar:
             year=y,
             month=m,
             day=d+1,
-            season=m//3%4,
+            season=m*len(SEASONS)//len(ml),
             magic=(self.total_days+off)//DAYS_IN_MAGIC_SEASON%3,
             strand=(self.total_days+off)//DAYS_IN_WEEK%96
         )
@@ -219,7 +261,7 @@ class FantasyCalendar:
 
     # ----- next dates (week hop for strand rules) -----    
     def next_dates_for(self,ev,n=5):
-        res=[]; off=1; limit=year_length(0)*400
+        res=[]; off=1; limit=self.tables.year_length(0)*400
         weekly=ev["rule"].startswith("strand")
         while len(res)<n and off<limit:
             c=self._comp(off)
@@ -233,7 +275,7 @@ class FantasyCalendar:
     # ----- same combo -----    
     def next_same_combo(self,n=10):
         cur=self._comp(); res=[]; off=DAYS_IN_WEEK
-        while len(res)<n and off<year_length(0)*400:
+        while len(res)<n and off<self.tables.year_length(0)*400:
             c=self._comp(off)
             if c["strand"]==cur["strand"] and c["magic"]==cur["magic"]:
                 res.append(self._fmt(c))
@@ -262,45 +304,46 @@ class FantasyCalendar:
     # ----- state (days) -----    
     def _load_state(self):
         try:
-            return int(open(self.STATE_FILE).read().strip())
+            return int(open(self._file("date",self.STATE_FILE)).read().strip())
         except:
-            open(self.STATE_FILE,"w").write("0")
+            open(self._file("date",self.STATE_FILE),"w").write("0")
             return 0
 
     def shift_days(self,d):
         self.total_days += d
-        open(self.STATE_FILE,"w").write(str(self.total_days))
+        open(self._file("date",self.STATE_FILE),"w").write(str(self.total_days))
 
     def set_date(self, year, month_1_based, day_1_based):
         # Clamp and validate month/day with leap-years
-        if month_1_based < 1 or month_1_based > 12:
-            raise ValueError("Month must be 1..12")
-        ml = month_lengths_for(year)
+        ml = self.tables.month_lengths_for(year)
+        if month_1_based < 1 or month_1_based > len(ml):
+            raise ValueError(f"Month must be 1..{len(ml)}")
         maxd = ml[month_1_based-1]
         if day_1_based < 1 or day_1_based > maxd:
             raise ValueError(f"Day must be 1..{maxd} for month {month_1_based} in year {year}")
         # compute absolute day index from epoch year 0, month 0
-        total = 0
-        y = 0
+        ys = self.tables.year_starts
+        y = max(0, min(year, len(ys)-1))
+        total = ys[y]
         while y < year:
-            total += year_length(y)
+            total += self.tables.year_length(y)
             y += 1
         for m in range(0, month_1_based-1):
             total += ml[m]
         total += (day_1_based - 1)
         self.total_days = total
-        open(self.STATE_FILE,"w").write(str(self.total_days))
+        open(self._file("date",self.STATE_FILE),"w").write(str(self.total_days))
 
     # ----- state (hours) -----    
     def _load_hour(self):
         try:
-            return int(open(self.HOUR_FILE).read().strip())
+            return int(open(self._file("hour",self.HOUR_FILE)).read().strip())
         except:
-            open(self.HOUR_FILE,"w").write("0")
+            open(self._file("hour",self.HOUR_FILE),"w").write("0")
             return 0
 
     def _save_hour(self):
-        open(self.HOUR_FILE,"w").write(str(self.current_hour))
+        open(self._file("hour",self.HOUR_FILE),"w").write(str(self.current_hour))
 
     def shift_hours(self,h):
         old = self.current_hour
@@ -314,12 +357,141 @@ class FantasyCalendar:
         self.current_hour = new
         self._save_hour()
 
+# ───────── CAMPAIGNS ─────────
+class Campaign:
+    """A named campaign: where its strands, notes, saved dates and state live."""
+    FILES = {
+        "strands": "strands.json",
+        "notes": "day_notes.json",
+        "saved_dates": "saved_dates.json",
+        "date": "current_date.txt",
+        "hour": "current_hour.txt",
+    }
+
+    def __init__(self, name, calendar=DEFAULT_CALENDAR, files=None):
+        self.name=name
+        self.calendar=calendar
+        self.files=dict(files or {})
+
+    @classmethod
+    def in_folder(cls, name, folder, calendar=DEFAULT_CALENDAR):
+        # stored with "/" so workspace.json works on every OS
+        return cls(name, calendar, {k:f"{folder}/{f}" for k,f in cls.FILES.items()})
+
+    def path(self,kind):
+        # absolute paths (including Windows drive paths) are used exactly as given
+        p=self.files[kind]
+        if os.path.isabs(p) or ntpath.isabs(p):
+            return p
+        return os.path.join(os.path.dirname(__file__), *p.split("/"))
+
+    def to_json(self):
+        return {"calendar": self.calendar, "files": self.files}
+
+class Workspace:
+    """
+    Every campaign the table runs. Only the active campaign has a loaded
+    FantasyCalendar; switching drops it (all edits are already on disk) and
+    loads the next one on first use.
+    """
+    def __init__(self, fname=WORKSPACE_FILE):
+        self._path=os.path.join(os.path.dirname(__file__),fname)
+        try:
+            data=json.load(open(self._path,encoding="utf-8"))
+        except (OSError, ValueError):
+            data={}
+        if not isinstance(data,dict):
+            data={}
+        self.campaigns={}
+        camps=data.get("campaigns")
+        for n,c in (camps.items() if isinstance(camps,dict) else ()):
+            # skip entries that don't name every campaign file
+            files=c.get("files") if isinstance(c,dict) else None
+            if not isinstance(files,dict) or not all(isinstance(files.get(k),str) for k in Campaign.FILES):
+                continue
+            self.campaigns[n]=Campaign(n,c.get("calendar",DEFAULT_CALENDAR),files)
+        if not self.campaigns:
+            # the original single-campaign setup
+            self.campaigns["Main"]=Campaign("Main",DEFAULT_CALENDAR,{
+                "strands":STRANDS_FILE,"notes":NOTES_FILE,"saved_dates":SAVED_DATES_FILE,
+                "date":FantasyCalendar.STATE_FILE,"hour":FantasyCalendar.HOUR_FILE})
+        self.active=data.get("active")
+        if self.active not in self.campaigns:
+            self.active=next(iter(self.campaigns))
+        self._cal=None
+
+    def _save(self,active=None):
+        data={"active":active or self.active,"campaigns":{n:c.to_json() for n,c in self.campaigns.items()}}
+        json.dump(data, open(self._path,"w",encoding="utf-8"), indent=2, ensure_ascii=False)
+
+    def names(self):
+        return list(self.campaigns.keys())
+
+    def calendar(self):
+        if self._cal is None:
+            self._cal=FantasyCalendar(self.campaigns[self.active])
+        return self._cal
+
+    def switch(self,name):
+        if name not in self.campaigns:
+            raise KeyError(f"No campaign named '{name}'")
+        if name!=self.active:
+            # load and save first, so any failure leaves the current one active
+            cal=FantasyCalendar(self.campaigns[name])
+            self._save(active=name)
+            self._cal=cal
+            self.active=name
+        return self.calendar()
+
+    def open_any(self):
+        """Load the active campaign, or else the first other one that loads.
+        Returns (calendar, error from the active campaign or None)."""
+        try:
+            return self.calendar(), None
+        except CAMPAIGN_ERRORS as e:
+            err=e
+        for name in self.names():
+            if name!=self.active:
+                try:
+                    return self.switch(name), err
+                except CAMPAIGN_ERRORS:
+                    pass
+        raise err
+
+    def create(self,name,calendar=DEFAULT_CALENDAR):
+        name=name.strip()
+        if not name:
+            raise ValueError("Campaign name required")
+        if name in self.campaigns:
+            raise ValueError(f"Campaign '{name}' already exists")
+        calendar_tables(calendar)
+        slug="".join(ch if ch.isalnum() or ch in "-_ " else "_" for ch in name).strip()
+        folder=f"{CAMPAIGNS_DIR}/{slug}"
+        while os.path.exists(os.path.join(os.path.dirname(__file__),CAMPAIGNS_DIR,slug)):
+            slug+="_"; folder+="_"
+        camp=Campaign.in_folder(name,folder,calendar)
+        os.makedirs(os.path.dirname(camp.path("strands")),exist_ok=True)
+        # start from the current campaign's strand table
+        src=self.campaigns[self.active].path("strands")
+        if os.path.exists(src):
+            shutil.copyfile(src,camp.path("strands"))
+        self.campaigns[name]=camp
+        try:
+            self._save()
+        except OSError:
+            del self.campaigns[name]
+            raise
+        return camp
+
 # ───────── UI ────────
 class CalendarApp(tk.Tk):
-    def __init__(self):
+    def __init__(self, workspace=None):
         super().__init__()
-        self.title("Strand Calendar — DM Edition")
-        self.cal = FantasyCalendar()
+        self.workspace = workspace or Workspace()
+        self.cal, err = self.workspace.open_any()
+        if err:
+            messagebox.showerror("Campaign", f"Could not open the last campaign, opened '{self.workspace.active}' instead: {err}", parent=self)
+        self._set_title()
 
         # Date label (row 0)
         self.date_lbl = ttk.Label(self, font=("Segoe UI",14))
@@ -394,8 +566,21 @@ class CalendarApp(tk.Tk):
         self.saved_combo.bind("<<ComboboxSelected>>", self.on_saved_selected)
         self.saved_combo.pack(side="left", padx=(4,0))
 
+        # Campaign frame (row 8)
+        self.campaign_frame = ttk.Frame(self)
+        self.campaign_frame.grid(row=8, column=0, columnspan=4, sticky="ew", padx=10, pady=(0,8))
+        ttk.Label(self.campaign_frame, text="Campaign:").pack(side="left", padx=(0,6))
+        self.campaign_combo = ttk.Combobox(self.campaign_frame, state="readonly", width=24, values=self.workspace.names())
+        self.campaign_combo.set(self.workspace.active)
+        self.campaign_combo.bind("<<ComboboxSelected>>", self.on_campaign_selected)
+        self.campaign_combo.pack(side="left", padx=(0,10))
+        ttk.Button(self.campaign_frame, text="New Campaign…", command=self.new_campaign_dialog).pack(side="left")
+
         self.refresh()
 
+    def _set_title(self):
+        self.title(f"Strand Calendar — DM Edition — {self.workspace.active}")
+
     # ----- move day/hour -----    
     def move_day(self,d):
         self.cal.shift_days(d)
@@ -453,6 +638,38 @@ class CalendarApp(tk.Tk):
             return
         self.refresh()
 
+    # ----- Campaigns -----
+    def switch_campaign(self, name):
+        try:
+            self.cal = self.workspace.switch(name)
+        except CAMPAIGN_ERRORS as e:
+            messagebox.showerror("Campaign", f"Could not open '{name}': {e}", parent=self)
+            self.campaign_combo.set(self.workspace.active)
+            return
+        self.campaign_combo["values"] = self.workspace.names()
+        self.campaign_combo.set(name)
+        self.saved_combo["values"] = self.cal.get_saved_names()
+        self.saved_combo.set("")
+        self.output.delete("1.0","end")
+        self._set_title()
+        self.refresh()
+
+    def on_campaign_selected(self, e):
+        name = self.campaign_combo.get()
+        if name and name != self.workspace.active:
+            self.switch_campaign(name)
+
+    def new_campaign_dialog(self):
+        name = simpledialog.askstring("New Campaign", "Name for the new campaign:", parent=self)
+        if not name:
+            return
+        try:
+            camp = self.workspace.create(name)
+        except CAMPAIGN_ERRORS as e:
+            messagebox.showerror("New Campaign", str(e), parent=self)
+            return
+        self.switch_campaign(camp.name)
+
     # ----- Party log -----    
     def party_changed(self,e):
         self.cal.set_party(self.party_txt.get("1.0","end-1c"))
@@ -0,0 +1,126 @@
+import json
+import os
+import pytest
+
+import CalendarApp as C
+
+
+# the original leap rule and year-by-year loops, kept as a reference
+def is_leap(y): return y%4==0
+def year_length(y): return 366 if is_leap(y) else 365
+def month_lengths_for(y):
+    ml=[31,28,31,30,31,30,31,31,30,31,30,31]
+    if is_leap(y): ml[1]=29
+    return ml
+
+
+def old_set_date(year, month_1_based, day_1_based):
+    ml = month_lengths_for(year)
+    total = 0
+    y = 0
+    while y < year:
+        total += year_length(y)
+        y += 1
+    for m in range(0, month_1_based-1):
+        total += ml[m]
+    return total + (day_1_based - 1)
+
+
+def old_comp(d):
+    y = 0
+    while d >= year_length(y):
+        d -= year_length(y); y += 1
+    ml = month_lengths_for(y)
+    m = 0
+    while d >= ml[m]:
+        d -= ml[m]; m += 1
+    return y, m, d+1
+
+
+@pytest.fixture
+def cal(tmp_path):
+    return C.FantasyCalendar(C.Campaign.in_folder("Test", str(tmp_path)))
+
+
+@pytest.mark.parametrize("year,month,day", [
+    (0, 1, 1), (0, 2, 29), (3, 12, 31), (310, 11, 25),
+    (-1, 1, 1), (-5, 3, 10),
+    (C.YEAR_TABLE_SPAN-1, 12, 31), (C.YEAR_TABLE_SPAN, 1, 1), (C.YEAR_TABLE_SPAN+7, 6, 15),
+])
+def test_set_date_matches_old_loop(cal, year, month, day):
+    cal.set_date(year, month, day)
+    assert cal.total_days == old_set_date(year, month, day)
+
+
+@pytest.mark.parametrize("td", [-3, 0, 59, 365, 366, 1461, 113556, 3652424, 3652425, 3652500, 5000000])
+def test_comp_matches_old_loop(cal, td):
+    cal.total_days = td
+    c = cal._comp()
+    assert (c["year"], c["month"], c["day"]) == old_comp(td)
+
+
+def two_campaigns(tmp_path):
+    ws = C.Workspace(str(tmp_path / "workspace.json"))
+    ws.campaigns = {"A": C.Campaign.in_folder("A", str(tmp_path / "a")),
+                    "B": C.Campaign.in_folder("B", str(tmp_path / "b"))}
+    ws.active = "A"
+    (tmp_path / "a").mkdir(); (tmp_path / "b").mkdir()
+    return ws
+
+
+def test_switch_keeps_active_when_campaign_fails_to_load(tmp_path):
+    ws = two_campaigns(tmp_path)
+    (tmp_path / "b" / "day_notes.json").write_text("{broken")
+    cal = ws.calendar()
+    with pytest.raises(ValueError):
+        ws.switch("B")
+    assert ws.active == "A" and ws.calendar() is cal
+    assert not (tmp_path / "workspace.json").exists()
+
+
+def test_create_rejects_unknown_calendar(tmp_path):
+    ws = C.Workspace(str(tmp_path / "workspace.json"))
+    with pytest.raises(KeyError):
+        ws.create("Elsewhere", calendar="no_such_calendar")
+    assert "Elsewhere" not in ws.campaigns
+
+
+def test_switch_keeps_active_when_workspace_save_fails(tmp_path):
+    ws = two_campaigns(tmp_path)
+    (tmp_path / "workspace.json").mkdir()   # makes writing it fail
+    cal = ws.calendar()
+    with pytest.raises(OSError):
+        ws.switch("B")
+    assert ws.active == "A" and ws.calendar() is cal
+
+
+def test_open_any_falls_back_when_active_fails(tmp_path):
+    ws = two_campaigns(tmp_path)
+    (tmp_path / "a" / "day_notes.json").write_text("{broken")
+    cal, err = ws.open_any()
+    assert isinstance(err, ValueError)
+    assert ws.active == "B" and cal.campaign is ws.campaigns["B"]
+
+
+def test_bad_workspace_file_falls_back_to_main(tmp_path):
+    path = tmp_path / "workspace.json"
+    path.write_text("{broken")
+    assert C.Workspace(str(path)).names() == ["Main"]
+
+
+def test_workspace_skips_campaigns_without_files(tmp_path):
+    path = tmp_path / "workspace.json"
+    good = C.Campaign.in_folder("Good", "campaigns/Good")
+    path.write_text(json.dumps({"active": "Bad", "campaigns": {
+        "Bad": {"calendar": "magic_seasons"},
+        "Partial": {"files": {"strands": "x.json"}},
+        "Good": good.to_json(),
+    }}))
+    ws = C.Workspace(str(path))
+    assert ws.names() == ["Good"] and ws.active == "Good"
+
+
+def test_campaign_paths_are_stored_with_slashes():
+    camp = C.Campaign.in_folder("X", "campaigns/X")
+    assert camp.to_json()["files"]["strands"] == "campaigns/X/strands.json"
+    assert camp.path("strands") == os.path.join(os.path.dirname(C.__file__), "campaigns", "X", "strands.json")